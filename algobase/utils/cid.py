@@ -3,10 +3,10 @@
 import multihash
 from algosdk import encoding
 from multiformats_cid import make_cid  # type: ignore[attr-defined]
-from pydantic import TypeAdapter
 from returns.pipeline import flow
 
 from algobase.types.annotated import AlgorandAddress
+from algobase.utils.validate import get_type_adapter
 
 
 def cid_to_algorand_address(cid: str) -> AlgorandAddress:
@@ -24,5 +24,5 @@ def cid_to_algorand_address(cid: str) -> AlgorandAddress:
         make_cid(cid).multihash,
         lambda h: multihash.decode(h).digest,
         encoding.encode_address,
-        TypeAdapter(AlgorandAddress).validate_python,
+        get_type_adapter(AlgorandAddress).validate_python,
     )
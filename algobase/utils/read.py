@@ -2,6 +2,10 @@
 
 import mimetypes
 import tomllib
+from functools import cache
+
+from babel import localedata
+from pydantic_core import Url
 
 
 def read_ipfs_gateways() -> list[str]:
@@ -15,6 +19,17 @@ def read_ipfs_gateways() -> list[str]:
     return list(data["ipfs_gateways"])
 
 
+@cache
+def read_ipfs_gateway_hosts() -> frozenset[str]:
+    """Read the hosts of the IPFS gateways in the reference data file.
+
+    Returns:
+        frozenset[str]: The set of IPFS gateway hosts.
+    """
+    hosts = (Url(gateway).host for gateway in read_ipfs_gateways())
+    return frozenset(host for host in hosts if host is not None)
+
+
 def read_mime_types() -> list[str]:
     """Read MIME types from the reference data file.
 
@@ -23,3 +38,23 @@ def read_mime_types() -> list[str]:
     """
     mimetypes.init()
     return list(mimetypes.types_map.values())
+
+
+@cache
+def read_mime_type_set() -> frozenset[str]:
+    """Read MIME types from the reference data file into a set.
+
+    Returns:
+        frozenset[str]: The set of MIME types.
+    """
+    return frozenset(read_mime_types())
+
+
+@cache
+def read_locale_identifiers() -> frozenset[str]:
+    """Read the Unicode CLDR locale identifiers from Babel's locale data.
+
+    Returns:
+        frozenset[str]: The set of locale identifiers.
+    """
+    return frozenset(localedata.locale_identifiers())
@@ -2,6 +2,10 @@
 
 from urllib.parse import quote, urlparse
 
+# Percent-encoded curly braces, i.e. '%7B' and '%7D'
+ENCODED_LEFT_BRACE = quote("{")
+ENCODED_RIGHT_BRACE = quote("}")
+
 
 def decode_url_braces(url: str) -> str:
     """Decodes curly braces in a URL string.
@@ -16,6 +20,8 @@ def decode_url_braces(url: str) -> str:
         str: The decoded URL string.
     """
     parsed_url = urlparse(url)
-    decoded_path = parsed_url.path.replace(quote("{"), "{").replace(quote("}"), "}")
+    decoded_path = parsed_url.path.replace(ENCODED_LEFT_BRACE, "{").replace(
+        ENCODED_RIGHT_BRACE, "}"
+    )
     decoded_url = parsed_url._replace(path=decoded_path).geturl()
     return decoded_url
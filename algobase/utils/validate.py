@@ -1,12 +1,11 @@
 """Functions for data validation."""
 
-import base64
 import binascii
-import hashlib
 import math
+import re
 import string
 from collections.abc import Callable, Iterable
-from functools import cache
+from functools import cache, lru_cache
 from typing import Any, overload
 
 from algosdk.encoding import is_valid_address
@@ -14,7 +13,25 @@ from babel import Locale, UnknownLocaleError
 from pydantic import TypeAdapter
 from pydantic_core import Url
 
-from algobase.utils.read import read_ipfs_gateways, read_mime_types
+from algobase.utils.read import (
+    read_ipfs_gateway_hosts,
+    read_locale_identifiers,
+    read_mime_type_set,
+)
+
+HEX_DIGITS = frozenset(string.hexdigits)
+
+# ARC-19 template that follows the 'template-ipfs://' scheme, with an optional path, query or fragment, e.g. {ipfscid:0:dag-pb:reserve:sha2-256}/arc3.json#arc3
+ARC19_TEMPLATE = re.compile(
+    r"\{ipfscid:(?:0:dag-pb|1:(?:raw|dag-pb)):reserve:sha2-256\}(?:[/?#].*)?",
+    re.DOTALL,
+)
+
+# Every power of 10 that fits in a uint64
+POWERS_OF_10 = frozenset(10**i for i in range(20))
+
+# Digest sizes in bytes of the hash algorithms supported in SRI values
+SRI_DIGEST_SIZES = {"sha256": 32, "sha384": 48, "sha512": 64}
 
 
 def is_valid(func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
@@ -38,6 +55,7 @@ def is_valid(func: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def validate_address(value: str) -> str:
     """Checks that the value is a valid Algorand address.
 
@@ -79,7 +97,9 @@ def validate_encoded_length(value: str | Url, max_length: int) -> str | Url:
         str | Url: The value passed in.
     """
     url = value if isinstance(value, str) else value.unicode_string()
-    if len(url.encode("utf-8")) > max_length:
+    # ASCII strings are one byte per character in UTF-8, so don't need encoding
+    encoded_length = len(url) if url.isascii() else len(url.encode("utf-8"))
+    if encoded_length > max_length:
         raise ValueError(f"'{value}' is > {max_length} bytes when encoded in UTF-8.")
     return value
 
@@ -97,12 +117,30 @@ def validate_not_ipfs_gateway(url: str) -> str:
     Returns:
         str: The URL passed in.
     """
-    gateways = read_ipfs_gateways()
-    if any(Url(gateway).host == Url(url).host for gateway in gateways):
-        raise ValueError(f"'{Url(url).host}' is an IPFS gateway.")
+    host = Url(url).host
+    if host in read_ipfs_gateway_hosts():
+        raise ValueError(f"'{host}' is an IPFS gateway.")
     return url
 
 
+def _decode_base64(value: str) -> bytes:
+    """Decodes a padded base64 string, rejecting any non-canonical input.
+
+    Args:
+        value (str): The value to decode.
+
+    Raises:
+        binascii.Error: If the value is not a valid base64 string.
+
+    Returns:
+        bytes: The decoded value.
+    """
+    # Padded base64 is always a multiple of 4 characters, so check the length before decoding
+    if len(value) % 4 != 0:
+        raise binascii.Error("Length is not a multiple of 4.")
+    return binascii.a2b_base64(value, strict_mode=True)
+
+
 def validate_base64(value: str) -> str:
     """Checks that the value is a valid base64 string.
 
@@ -116,7 +154,7 @@ def validate_base64(value: str) -> str:
         str: The value passed in.
     """
     try:
-        base64.b64decode(value, validate=True)
+        _decode_base64(value)
     except binascii.Error:
         raise ValueError(f"'{value}' is not valid base64.")
     return value
@@ -134,23 +172,21 @@ def validate_sri(value: str) -> str:
     Returns:
         str: The value passed in.
     """
-    supported_algorithms = {"sha256", "sha384", "sha512"}
-    hash_algorithm = next(
-        (x for x in supported_algorithms if value.startswith(f"{x}-")), None
-    )
-    if hash_algorithm is None:
+    hash_algorithm, separator, hash_digest = value.partition("-")
+    digest_size = SRI_DIGEST_SIZES.get(hash_algorithm)
+    if not separator or digest_size is None:
         raise ValueError(
             f"'{value}' is not a valid SRI. String must start with 'sha256-', 'sha384-', or 'sha512-'."
         )
-    hasher = hashlib.new(hash_algorithm)
-    hash_digest = value.removeprefix(f"{hash_algorithm}-")
     try:
-        validate_base64(hash_digest)
-    except ValueError as e:
-        raise ValueError(f"'{value}' is not a valid SRI. Hash digest {e}")
-    if len(base64.b64decode(hash_digest)) != hasher.digest_size:
+        digest = _decode_base64(hash_digest)
+    except ValueError:
+        raise ValueError(
+            f"'{value}' is not a valid SRI. Hash digest '{hash_digest}' is not valid base64."
+        )
+    if len(digest) != digest_size:
         raise ValueError(
-            f"'{value}' is not a valid SRI. Expected {hasher.digest_size} byte hash digest, got {len(hash_digest)} bytes."
+            f"'{value}' is not a valid SRI. Expected {digest_size} byte hash digest, got {len(digest)} bytes."
         )
     return value
 
@@ -191,7 +227,7 @@ def validate_mime_type(value: str, primary_type: str | None = None) -> str:
     Returns:
         str: The value passed in.
     """
-    if value not in read_mime_types():
+    if value not in read_mime_type_set():
         raise ValueError(f"'{value}' is not a valid MIME type.")
     if primary_type is not None and not value.startswith(f"{primary_type}/"):
         raise ValueError(f"'{value}' is not a valid {primary_type} MIME type.")
@@ -210,11 +246,12 @@ def validate_hex(value: str) -> str:
     Returns:
         str: The value passed in.
     """
-    if not all(x in string.hexdigits for x in value):
+    if not HEX_DIGITS.issuperset(value):
         raise ValueError(f"'{value}' is not a valid hex string.")
     return value
 
 
+@cache
 def validate_locale(value: str) -> str:
     """Checks that the value is a valid Unicode CLDR locale.
 
@@ -228,6 +265,8 @@ def validate_locale(value: str) -> str:
     Returns:
         str: The value passed in.
     """
+    if value in read_locale_identifiers():
+        return value
     try:
         Locale.parse(value)
     except ValueError as e:
@@ -286,11 +325,28 @@ def validate_is_power_of_10(n: int) -> int:
     Returns:
         int: The value passed in.
     """
-    if not (n > 0 and math.log10(n).is_integer()):
+    if n in POWERS_OF_10:
+        return n
+    # Only 10**e and 10**(e + 1) can have the same bit length as n
+    e = int((n.bit_length() - 1) * math.log10(2))
+    if n <= 0 or n not in (10**e, 10 ** (e + 1)):
         raise ValueError(f"{n} is not a power of 10.")
     return n
 
 
+@cache
+def get_type_adapter(_type: type) -> TypeAdapter[Any]:
+    """Returns a Pydantic type adapter for the type, built once per type.
+
+    Args:
+        _type (type): The type to build the adapter for.
+
+    Returns:
+        TypeAdapter[Any]: The type adapter.
+    """
+    return TypeAdapter(_type)
+
+
 def validate_type_compatibility(value: str, _type: type) -> str:
     """Checks that the value is compatible with the annotated type.
 
@@ -304,7 +360,7 @@ def validate_type_compatibility(value: str, _type: type) -> str:
     Returns:
         str: The value passed in.
     """
-    TypeAdapter(_type).validate_python(value)
+    get_type_adapter(_type).validate_python(value)
     return value
 
 
@@ -322,14 +378,6 @@ def validate_arc19_asset_url(value: str) -> str:
     """
     if not value.startswith("template-ipfs://"):
         raise ValueError("ARC-19 asset URL must start with 'template-ipfs://'")
-
-    # Extract the template substring from the URL, e.g. {ipfscid:0:dag-pb:reserve:sha2-256}
-    template = value[value.find("{") + 1 : value.find("}")]
-    match template.split(":"):
-        case ["ipfscid", "0", "dag-pb", "reserve", "sha2-256"]:
-            ...
-        case ["ipfscid", "1", "raw" | "dag-pb", "reserve", "sha2-256"]:
-            ...
-        case _:
-            raise ValueError("Asset URL template must follow ARC-19 specification")
+    if not ARC19_TEMPLATE.fullmatch(value, len("template-ipfs://")):
+        raise ValueError("Asset URL template must follow ARC-19 specification")
     return value
@@ -4,6 +4,7 @@ from copy import deepcopy
 
 import pytest
 
+from algobase.models.asa import Asa
 from tests.types import FixtureDict
 
 arc3_metadata = {
@@ -64,6 +65,24 @@ arc3_metadata = {
 }
 
 
+asa_nft = {
+    "asset_params": {
+        "total": 1,
+        "decimals": 0,
+        "default_frozen": False,
+        "unit_name": "USDT",
+        "asset_name": "My Song",
+        "url": "https://tether.to/#arc3",
+        "metadata_hash": b"fACPO4nRgO55j1ndAK3W6Sgc4APkcyFh",
+        "manager": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
+        "reserve": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
+        "freeze": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
+        "clawback": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
+    },
+    "metadata": {**arc3_metadata, "arc": "arc3"},
+}
+
+
 @pytest.fixture
 def arc3_metadata_fixture() -> FixtureDict:
     """Pytest fixture for a dictionary containing valid ARC-3 metadata.
@@ -102,24 +121,19 @@ def asa_nft_fixture() -> FixtureDict:
     Returns:
         FixtureDict: The dictionary of valid ASA data.
     """
-    metadata = deepcopy(arc3_metadata)
-    metadata["arc"] = "arc3"
-    return {
-        "asset_params": {
-            "total": 1,
-            "decimals": 0,
-            "default_frozen": False,
-            "unit_name": "USDT",
-            "asset_name": "My Song",
-            "url": "https://tether.to/#arc3",
-            "metadata_hash": b"fACPO4nRgO55j1ndAK3W6Sgc4APkcyFh",
-            "manager": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
-            "reserve": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
-            "freeze": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
-            "clawback": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
-        },
-        "metadata": metadata,
-    }
+    return deepcopy(asa_nft)
+
+
+@pytest.fixture(scope="session")
+def asa_nft_model() -> Asa:
+    """Pytest fixture for an `Asa` model validated from `asa_nft`.
+
+    The model is frozen, so a single instance is shared by every test that only reads from it.
+
+    Returns:
+        Asa: The validated `Asa` model.
+    """
+    return Asa.model_validate(deepcopy(asa_nft))
 
 
 @pytest.fixture
@@ -10,15 +10,18 @@ from algobase.models.asa import Asa
 from algobase.models.asset_params import AssetParams
 from tests.types import FixtureDict
 
+rebuilt_annotations = {
+    name: field.rebuild_annotation() for name, field in Asa.model_fields.items()
+}
+
 
 @pytest.mark.filterwarnings("ignore::UserWarning")
 class TestAsa:
     """Tests the `Asa` Pydantic model."""
 
-    def test_valid_dict(self, asa_nft_fixture: FixtureDict) -> None:
+    def test_valid_dict(self, asa_nft_model: Asa) -> None:
         """Test that validation succeeds when passed a valid dictionary."""
-        print(Asa.model_validate(asa_nft_fixture))
-        assert Asa.model_validate(asa_nft_fixture)
+        assert asa_nft_model
 
     @pytest.mark.parametrize(
         "field, expected_type",
@@ -28,15 +31,15 @@ class TestAsa:
     )
     def test_annotated_types(self, field: str, expected_type: type) -> None:
         """Test that annotated types are correct."""
-        assert Asa.model_fields[field].rebuild_annotation() == expected_type
+        assert rebuilt_annotations[field] == expected_type
 
-    def test_asset_params_model(self, asa_nft_fixture: FixtureDict) -> None:
+    def test_asset_params_model(self, asa_nft_model: Asa) -> None:
         """Test that the `asset_params` field is an `AssetParams` model."""
-        assert isinstance(Asa.model_validate(asa_nft_fixture).asset_params, AssetParams)
+        assert isinstance(asa_nft_model.asset_params, AssetParams)
 
-    def test_metadata_model(self, asa_nft_fixture: FixtureDict) -> None:
+    def test_metadata_model(self, asa_nft_model: Asa) -> None:
         """Test that the `metadata` field is an `Arc3Metadata` model."""
-        assert isinstance(Asa.model_validate(asa_nft_fixture).metadata, Arc3Metadata)
+        assert isinstance(asa_nft_model.metadata, Arc3Metadata)
 
     def test_metadata_hash_none(self, asa_nft_fixture: FixtureDict) -> None:
         """Test that the metadata hash is None when passed a dict with no metadata."""
@@ -227,7 +230,16 @@ class TestAsa:
         test_dict["asa_type"] = asa_type
         assert Asa.model_validate(test_dict).derived_asa_type == asa_type
 
-    def test_derived_arc3_metadata(self, arc3_metadata_fixture: FixtureDict) -> None:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "template-ipfs://{ipfscid:0:dag-pb:reserve:sha2-256}/arc3.json#arc3",
+            "template-ipfs://{ipfscid:1:raw:reserve:sha2-256}#arc3",
+        ],
+    )
+    def test_derived_arc3_metadata(
+        self, arc3_metadata_fixture: FixtureDict, url: str
+    ) -> None:
         """Test that the derived ARC-3 metadata is correct."""
         arc3_dict = arc3_metadata_fixture.copy()
         arc3_dict.pop("extra_metadata")
@@ -239,7 +251,7 @@ class TestAsa:
                 "default_frozen": False,
                 "unit_name": "USDT",
                 "asset_name": "My Song",
-                "url": "template-ipfs://{ipfscid:0:dag-pb:reserve:sha2-256}/arc3.json#arc3",
+                "url": url,
                 "metadata_hash": b"fACPO4nRgO55j1ndAK3W6Sgc4APkcyFh",
                 "manager": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
                 "reserve": "EEQYWGGBHRDAMTEVDPVOSDVX3HJQIG6K6IVNR3RXHYOHV64ZWAEISS4CTI",
@@ -1,7 +1,8 @@
 """Unit tests for the AssetParams Pydantic model."""
 
 
-from types import SimpleNamespace
+from copy import deepcopy
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
@@ -16,12 +17,14 @@ from algobase.types.annotated import (
     AsaUrl,
     Uint64,
 )
+from tests.types import FixtureDict
 
+rebuilt_annotations = {
+    name: field.rebuild_annotation() for name, field in AssetParams.model_fields.items()
+}
 
-class TestAssetParams:
-    """Tests the `AssetParams` Pydantic model."""
-
-    valid_dict = {
+valid_asset_params = MappingProxyType(
+    {
         "total": 1,
         "decimals": 0,
         "default_frozen": False,
@@ -34,10 +37,115 @@ class TestAssetParams:
         "freeze": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
         "clawback": "7ZUECA7HFLZTXENRV24SHLU4AVPUTMTTDUFUBNBD64C73F3UHRTHAIOF6Q",
     }
+)
+
+# The same asset params in string form, e.g. as parsed from a query string or environment variables.
+# A plain dict, as `model_validate_strings` doesn't accept other mapping types.
+valid_asset_params_strings = {
+    k: v.decode() if isinstance(v, bytes) else str(v)
+    for k, v in valid_asset_params.items()
+}
+
+# Asset info responses for USDC, as returned by Indexer and by Algod
+indexer_asset_info = {
+    "asset": {
+        "created-at-round": 8874561,
+        "deleted": False,
+        "index": 31566704,
+        "params": {
+            "clawback": "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ",
+            "creator": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
+            "decimals": 6,
+            "default-frozen": False,
+            "freeze": "3ERES6JFBIJ7ZPNVQJNH2LETCBQWUPGTO4ROA6VFUR25WFSYKGX3WBO5GE",
+            "manager": "37XL3M57AXBUJARWMT5R7M35OERXMH3Q22JMMEFLBYNDXXADGFN625HAL4",
+            "metadata-hash": "MWQ3NWYwNGYwZmE5NDA3MDkxOWZkZDNlY2FhMmM1ZmQ=",
+            "name": "USDC",
+            "name-b64": "VVNEQw==",
+            "reserve": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
+            "total": 18446744073709551615,
+            "unit-name": "USDC",
+            "unit-name-b64": "VVNEQw==",
+            "url": "https://www.centre.io/usdc",
+            "url-b64": "aHR0cHM6Ly93d3cuY2VudHJlLmlvL3VzZGM=",
+        },
+    },
+    "current-round": 41738357,
+}
+algod_asset_info = {
+    "index": 31566704,
+    "params": {
+        "creator": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
+        "decimals": 6,
+        "default-frozen": False,
+        "freeze": "3ERES6JFBIJ7ZPNVQJNH2LETCBQWUPGTO4ROA6VFUR25WFSYKGX3WBO5GE",
+        "manager": "37XL3M57AXBUJARWMT5R7M35OERXMH3Q22JMMEFLBYNDXXADGFN625HAL4",
+        "name": "USDC",
+        "name-b64": "VVNEQw==",
+        "reserve": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
+        "total": 18446744073709551615,
+        "unit-name": "USDC",
+        "unit-name-b64": "VVNEQw==",
+        "url": "https://www.centre.io/usdc",
+        "url-b64": "aHR0cHM6Ly93d3cuY2VudHJlLmlvL3VzZGM=",
+    },
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[indexer_asset_info, algod_asset_info],
+    ids=["indexer", "algod"],
+)
+def algod_client(request: pytest.FixtureRequest) -> SimpleNamespace:
+    """Pytest fixture for a mock Algod client, shared across the module.
+
+    `AssetParams.from_algod` modifies the response in place, so each call returns a copy.
+
+    Returns:
+        SimpleNamespace: The mock Algod client.
+    """
+    response = request.param
+    return SimpleNamespace(asset_info=lambda _: deepcopy(response))
+
+
+@pytest.fixture(scope="class")
+def default_asset_params() -> AssetParams:
+    """Pytest fixture for an `AssetParams` model with only the mandatory fields set.
+
+    Uses `model_construct`, as the tests that use it only inspect the default values.
+
+    Returns:
+        AssetParams: The model with default values for all non-mandatory fields.
+    """
+    return AssetParams.model_construct(total=1)
+
+
+@pytest.fixture
+def asset_params_dict(request: pytest.FixtureRequest) -> FixtureDict:
+    """Pytest fixture for a dictionary of valid asset params with one field overridden.
+
+    Parametrize indirectly with a `(field, value)` tuple.
+
+    Returns:
+        FixtureDict: The dictionary of asset params.
+    """
+    field, value = request.param
+    return {**valid_asset_params, field: value}
+
+
+class TestAssetParams:
+    """Tests the `AssetParams` Pydantic model."""
 
     def test_valid_dict(self) -> None:
         """Test that validation succeeds when passed a valid dictionary."""
-        assert AssetParams.model_validate(self.valid_dict)
+        assert AssetParams.model_validate({**valid_asset_params})
+
+    def test_valid_strings(self) -> None:
+        """Test that validating string data gives the same model as validating the original values."""
+        assert AssetParams.model_validate_strings(
+            valid_asset_params_strings
+        ) == AssetParams.model_validate({**valid_asset_params})
 
     @pytest.mark.parametrize(
         "field, expected_type",
@@ -56,13 +164,12 @@ class TestAssetParams:
     )
     def test_annotated_types(self, field: str, expected_type: type) -> None:
         """Test that annotated types are correct."""
-        assert AssetParams.model_fields[field].rebuild_annotation() == expected_type
+        assert rebuilt_annotations[field] == expected_type
 
     @pytest.mark.parametrize("field", ["total"])
     def test_mandatory_fields(self, field: str) -> None:
         """Test that validation fails if a mandatory field is missing."""
-        test_dict = self.valid_dict.copy()
-        test_dict.pop(field)
+        test_dict = {k: v for k, v in valid_asset_params.items() if k != field}
         with pytest.raises(ValidationError):
             AssetParams.model_validate(test_dict)
 
@@ -81,120 +188,94 @@ class TestAssetParams:
             ("clawback", None),
         ],
     )
-    def test_default_values(self, field: str, expected: int | bool | None) -> None:
+    def test_default_values(
+        self,
+        default_asset_params: AssetParams,
+        field: str,
+        expected: int | bool | None,
+    ) -> None:
         """Test that non-mandatory fields have the correct default values."""
-        test_dict = self.valid_dict.copy()
-        test_dict.pop(field)
-        assert getattr(AssetParams.model_validate(test_dict), field) == expected
+        assert getattr(default_asset_params, field) == expected
 
-    @pytest.mark.parametrize("x", [1.0, "1"])
-    def test_total_invalid_strict(self, x: float | str) -> None:
+    @pytest.mark.parametrize(
+        "asset_params_dict",
+        [("total", 1.0), ("total", "1")],
+        indirect=True,
+        ids=["1.0", "'1'"],
+    )
+    def test_total_invalid_strict(self, asset_params_dict: FixtureDict) -> None:
         """Test that `total` raises an error in strict mode if passed a float or a string."""
-        test_dict = self.valid_dict.copy()
-        test_dict["total"] = x
         with pytest.raises(ValidationError):
-            AssetParams.model_validate(test_dict, strict=True)
+            AssetParams.model_validate(asset_params_dict, strict=True)
 
-    @pytest.mark.parametrize("x, expected", [(1.0, 1), ("1", 1)])
+    @pytest.mark.parametrize(
+        "asset_params_dict, expected",
+        [(("total", 1.0), 1), (("total", "1"), 1)],
+        indirect=["asset_params_dict"],
+        ids=["1.0", "'1'"],
+    )
     def test_total_valid_non_strict_coerced(
-        self, x: float | str, expected: int
+        self, asset_params_dict: FixtureDict, expected: int
     ) -> None:
         """Test that `total` does not raise an error in non-strict mode if passed a float or a string."""
-        test_dict = self.valid_dict.copy()
-        test_dict["total"] = x
-        assert AssetParams.model_validate(test_dict, strict=False).total == expected
+        assert (
+            AssetParams.model_validate(asset_params_dict, strict=False).total
+            == expected
+        )
 
-    @pytest.mark.parametrize("x", [1, 1.0, "True", "true"])
-    def test_default_frozen_invalid_strict(self, x: int | float | str) -> None:
+    @pytest.mark.parametrize(
+        "asset_params_dict",
+        [
+            ("default_frozen", 1),
+            ("default_frozen", 1.0),
+            ("default_frozen", "True"),
+            ("default_frozen", "true"),
+        ],
+        indirect=True,
+        ids=["1", "1.0", "'True'", "'true'"],
+    )
+    def test_default_frozen_invalid_strict(
+        self, asset_params_dict: FixtureDict
+    ) -> None:
         """Test that `default_frozen` raises an error in strict mode if passed a non-boolean type."""
-        test_dict = self.valid_dict.copy()
-        test_dict["default_frozen"] = x
         with pytest.raises(ValidationError):
-            AssetParams.model_validate(test_dict, strict=True)
+            AssetParams.model_validate(asset_params_dict, strict=True)
 
     @pytest.mark.parametrize(
-        "x, expected",
+        "asset_params_dict, expected",
         [
-            (1, True),
-            (1.0, True),
-            ("True", True),
-            ("true", True),
-            (0, False),
-            (0.0, False),
-            ("False", False),
-            ("false", False),
+            (("default_frozen", 1), True),
+            (("default_frozen", 1.0), True),
+            (("default_frozen", "True"), True),
+            (("default_frozen", "true"), True),
+            (("default_frozen", 0), False),
+            (("default_frozen", 0.0), False),
+            (("default_frozen", "False"), False),
+            (("default_frozen", "false"), False),
         ],
+        indirect=["asset_params_dict"],
+        ids=["1", "1.0", "'True'", "'true'", "0", "0.0", "'False'", "'false'"],
     )
     def test_default_frozen_non_strict(
-        self, x: int | float | str, expected: bool
+        self, asset_params_dict: FixtureDict, expected: bool
     ) -> None:
         """Test that `default_frozen` does not raise an error in non-strict mode if passed a valid non-boolean type value."""
-        test_dict = self.valid_dict.copy()
-        test_dict["default_frozen"] = x
         assert (
-            AssetParams.model_validate(test_dict, strict=False).default_frozen
+            AssetParams.model_validate(asset_params_dict, strict=False).default_frozen
             == expected
         )
 
-    def test_from_algod(self) -> None:
+    def test_from_algod(self, algod_client: SimpleNamespace) -> None:
         """Tests the `from_algod` class method."""
-        algod_client = SimpleNamespace()
-        algod_client.asset_info = lambda _: {
-            "asset": {
-                "created-at-round": 8874561,
-                "deleted": False,
-                "index": 31566704,
-                "params": {
-                    "clawback": "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ",
-                    "creator": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
-                    "decimals": 6,
-                    "default-frozen": False,
-                    "freeze": "3ERES6JFBIJ7ZPNVQJNH2LETCBQWUPGTO4ROA6VFUR25WFSYKGX3WBO5GE",
-                    "manager": "37XL3M57AXBUJARWMT5R7M35OERXMH3Q22JMMEFLBYNDXXADGFN625HAL4",
-                    "metadata-hash": "MWQ3NWYwNGYwZmE5NDA3MDkxOWZkZDNlY2FhMmM1ZmQ=",
-                    "name": "USDC",
-                    "name-b64": "VVNEQw==",
-                    "reserve": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
-                    "total": 18446744073709551615,
-                    "unit-name": "USDC",
-                    "unit-name-b64": "VVNEQw==",
-                    "url": "https://www.centre.io/usdc",
-                    "url-b64": "aHR0cHM6Ly93d3cuY2VudHJlLmlvL3VzZGM=",
-                },
-            },
-            "current-round": 41738357,
-        }
-        asset_params = AssetParams.from_algod(algod_client, 31566704)  # type: ignore[arg-type]
-
-        assert asset_params.unit_name == "USDC"
-        assert asset_params.asset_name == "USDC"
-        assert asset_params.decimals == 6
-
-        algod_client.asset_info = lambda _: {
-            "index": 31566704,
-            "params": {
-                "creator": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
-                "decimals": 6,
-                "default-frozen": False,
-                "freeze": "3ERES6JFBIJ7ZPNVQJNH2LETCBQWUPGTO4ROA6VFUR25WFSYKGX3WBO5GE",
-                "manager": "37XL3M57AXBUJARWMT5R7M35OERXMH3Q22JMMEFLBYNDXXADGFN625HAL4",
-                "name": "USDC",
-                "name-b64": "VVNEQw==",
-                "reserve": "2UEQTE5QDNXPI7M3TU44G6SYKLFWLPQO7EBZM7K7MHMQQMFI4QJPLHQFHM",
-                "total": 18446744073709551615,
-                "unit-name": "USDC",
-                "unit-name-b64": "VVNEQw==",
-                "url": "https://www.centre.io/usdc",
-                "url-b64": "aHR0cHM6Ly93d3cuY2VudHJlLmlvL3VzZGM=",
-            },
-        }
         asset_params = AssetParams.from_algod(algod_client, 31566704)  # type: ignore[arg-type]
 
         assert asset_params.unit_name == "USDC"
         assert asset_params.asset_name == "USDC"
         assert asset_params.decimals == 6
 
-        asset_params = AssetParams.from_algod(algod_client, 0)  # type: ignore[arg-type]
+    def test_from_algod_algo(self) -> None:
+        """Tests that the `from_algod` class method returns the ALGO params for asset ID 0, without calling Algod."""
+        asset_params = AssetParams.from_algod(SimpleNamespace(), 0)  # type: ignore[arg-type]
 
         assert asset_params.unit_name == "ALGO"
         assert asset_params.asset_name == "ALGO"
@@ -3,22 +3,22 @@
 from algobase.settings import Settings
 
 
-class TestSettings:
-    """Tests for the `Settings` class."""
+def is_settings(settings: Settings) -> bool:
+    """Function to test that a settings object can be piped to a callable.
 
-    def test_settings(self) -> None:
-        """Test that the settings are loaded correctly."""
+    Args:
+        settings (Settings): The settings object.
 
-        def callable(settings: Settings) -> bool:
-            """Function to test that a settings object can be piped to a callable.
+    Returns:
+        bool: True if the object passed is a settings object.
+    """
+    return isinstance(settings, Settings)
 
-            Args:
-                settings (Settings): The settings object.
 
-            Returns:
-                bool: True if the object passed is a settings object.
-            """
-            return isinstance(settings, Settings)
+class TestSettings:
+    """Tests for the `Settings` class."""
 
+    def test_settings(self) -> None:
+        """Test that the settings are loaded correctly."""
         settings = Settings()
-        assert settings | callable
+        assert settings | is_settings
@@ -1,5 +1,8 @@
 """Unit tests for the annotated types."""
 
+import re
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 from algosdk.constants import HASH_LEN, MAX_ASSET_DECIMALS
@@ -27,39 +30,79 @@ from algobase.types.annotated import (
     UnicodeLocale,
 )
 
+# Error message raised by pydantic for numeric bound constraints (`Ge`, `Gt`, `Le`, `Lt`)
+OUT_OF_BOUNDS_ERROR = re.compile(r"Input should be (greater|less) than")
+
+# URL that is 97 bytes long when encoded in UTF-8 (max is 96)
+LONG_URL = "https://www.example.com/1234567890123456789012345678901234567890123456789012345678901234567890123"
+VALID_ADDRESS = "VCMJKWOY5P5P7SKMZFFOCEROPJCZOTIJMNIYNUCKH7LRO45JMJP6UYBIJA"
+VALID_BASE64 = "iHcUslDaL/jEM/oTxqEX++4CS8o3+IZp7/V5Rgchqwc="
+VALID_SRI = "sha256-LwArA6xMdnFF3bvQjwODpeTG/RVn61weQSuoRyynA1I="
+ZERO_HASH = bytes(HASH_LEN)
+SHORT_HASH = bytes(HASH_LEN - 1)
+LONG_HASH = bytes(HASH_LEN + 1)
+
+valid_traits = MappingProxyType(
+    {
+        "background": "red",
+        "shirt_color": "blue",
+        "glasses": "none",
+        "tattoos": 4,
+    }
+)
+valid_non_trait_properties = MappingProxyType(
+    {
+        "creator": "Tim Smith",
+        "created_at": "January 2, 2022",
+        "rich_property": {
+            "string": "Name",
+            "int": 1,
+            "float": 3.14,
+            "list": ["a", "b", "c"],
+            "css": {
+                "color": "#ffffff",
+                "font-weight": "bold",
+                "text-decoration": "underline",
+            },
+        },
+    }
+)
+
 
 class TestUint32:
     """Test the `Uint32` type."""
 
     ta = TypeAdapter(Uint32)
+    ta_list = TypeAdapter(list[Uint32])
 
-    @pytest.mark.parametrize("n", [-1, 2**32])
-    def test_uint32_out_of_bounds(self, n: int) -> None:
-        """Test that `Uint32` raises an error if the value is out of bounds."""
-        with pytest.raises(ValidationError):
-            self.ta.validate_python(n)
+    def test_uint32_out_of_bounds(self) -> None:
+        """Test that `Uint32` raises an error if a value is out of bounds."""
+        for n in (-1, 2**32):
+            with pytest.raises(ValidationError, match=OUT_OF_BOUNDS_ERROR):
+                self.ta.validate_python(n)
 
-    @pytest.mark.parametrize("n", [0, 1, 2**32 - 1])
-    def test_uint32_in_bounds(self, n: int) -> None:
-        """Test that `Uint32` returns the original value  if the value is in bounds."""
-        assert self.ta.validate_python(n) == n
+    def test_uint32_in_bounds(self) -> None:
+        """Test that `Uint32` returns the original values if the values are in bounds."""
+        values = [0, 1, 2**32 - 1]
+        assert self.ta_list.validate_python(values) == values
 
 
 class TestUint64:
     """Test the `Uint64` type."""
 
     ta = TypeAdapter(Uint64)
+    ta_list = TypeAdapter(list[Uint64])
 
-    @pytest.mark.parametrize("n", [-1, 2**64])
-    def test_uint64_out_of_bounds(self, n: int) -> None:
-        """Test that `Uint64` raises an error if the value is out of bounds."""
-        with pytest.raises(ValidationError):
-            self.ta.validate_python(n)
+    def test_uint64_out_of_bounds(self) -> None:
+        """Test that `Uint64` raises an error if a value is out of bounds."""
+        for n in (-1, 2**64):
+            with pytest.raises(ValidationError, match=OUT_OF_BOUNDS_ERROR):
+                self.ta.validate_python(n)
 
-    @pytest.mark.parametrize("n", [0, 1, 2**64 - 1])
-    def test_uint64_in_bounds(self, n: int) -> None:
-        """Test that `Uint64` returns the original value  if the value is in bounds."""
-        assert self.ta.validate_python(n) == n
+    def test_uint64_in_bounds(self) -> None:
+        """Test that `Uint64` returns the original values if the values are in bounds."""
+        values = [0, 1, 2**64 - 1]
+        assert self.ta_list.validate_python(values) == values
 
 
 class TestAlgorandHash:
@@ -68,7 +111,9 @@ class TestAlgorandHash:
     ta = TypeAdapter(AlgorandHash)
 
     @pytest.mark.parametrize(
-        "x", [b"", b"\x00" * (HASH_LEN - 1), b"\x00" * (HASH_LEN + 1)]
+        "x",
+        [b"", SHORT_HASH, LONG_HASH],
+        ids=["empty", "too_short", "too_long"],
     )
     def test_algorand_hash_length_invalid(self, x: bytes) -> None:
         """Test that `AlgorandHash` raises an error if the length of the value is not 32 bytes."""
@@ -77,7 +122,7 @@ class TestAlgorandHash:
 
     def test_algorand_hash_length_valid(self) -> None:
         """Test that `AlgorandHash` returns the original value if the length of the value is 32 bytes."""
-        assert self.ta.validate_python(b"\x00" * HASH_LEN) == b"\x00" * HASH_LEN
+        assert self.ta.validate_python(ZERO_HASH) == ZERO_HASH
 
 
 class TestBase64Str:
@@ -100,10 +145,7 @@ class TestBase64Str:
 
     def test_base64str_valid(self):
         """Test that `Base64Str` returns the original value  if the value is valid."""
-        assert (
-            self.ta.validate_python("iHcUslDaL/jEM/oTxqEX++4CS8o3+IZp7/V5Rgchqwc=")
-            == "iHcUslDaL/jEM/oTxqEX++4CS8o3+IZp7/V5Rgchqwc="
-        )
+        assert self.ta.validate_python(VALID_BASE64) == VALID_BASE64
 
 
 class TestAlgorandAddress:
@@ -121,29 +163,25 @@ class TestAlgorandAddress:
 
     def test_algorand_address_valid(self) -> None:
         """Test that `AlgorandAddress` returns the original value  if the value is valid."""
-        assert (
-            self.ta.validate_python(
-                "VCMJKWOY5P5P7SKMZFFOCEROPJCZOTIJMNIYNUCKH7LRO45JMJP6UYBIJA"
-            )
-            == "VCMJKWOY5P5P7SKMZFFOCEROPJCZOTIJMNIYNUCKH7LRO45JMJP6UYBIJA"
-        )
+        assert self.ta.validate_python(VALID_ADDRESS) == VALID_ADDRESS
 
 
 class TestAsaDecimals:
     """Test the `AsaDecimals` type."""
 
     ta = TypeAdapter(AsaDecimals)
+    ta_list = TypeAdapter(list[AsaDecimals])
 
-    @pytest.mark.parametrize("n", [-1, 20])
-    def test_asa_decimals_out_of_bounds(self, n: int) -> None:
-        """Test that `AsaDecimals` raises an error if the value is out of bounds."""
-        with pytest.raises(ValidationError):
-            self.ta.validate_python(n)
+    def test_asa_decimals_out_of_bounds(self) -> None:
+        """Test that `AsaDecimals` raises an error if a value is out of bounds."""
+        for n in (-1, 20):
+            with pytest.raises(ValidationError, match=OUT_OF_BOUNDS_ERROR):
+                self.ta.validate_python(n)
 
-    @pytest.mark.parametrize("n", [0, 1, MAX_ASSET_DECIMALS])
-    def test_asa_decimals_in_bounds(self, n: int) -> None:
-        """Test that `AsaDecimals` does not raise an error if the value is in bounds."""
-        assert self.ta.validate_python(n) == n
+    def test_asa_decimals_in_bounds(self) -> None:
+        """Test that `AsaDecimals` does not raise an error if the values are in bounds."""
+        values = [0, 1, MAX_ASSET_DECIMALS]
+        assert self.ta_list.validate_python(values) == values
 
 
 class TestAsaFractionalNftTotal:
@@ -151,11 +189,11 @@ class TestAsaFractionalNftTotal:
 
     ta = TypeAdapter(AsaFractionalNftTotal)
 
-    @pytest.mark.parametrize("n", [-1, 0, 2**64])
-    def test_asa_fractional_nft_total_out_of_bounds(self, n: int) -> None:
-        """Test that `AsaFractionalNftTotal` raises an error if the value is out of bounds."""
-        with pytest.raises(ValidationError):
-            self.ta.validate_python(n)
+    def test_asa_fractional_nft_total_out_of_bounds(self) -> None:
+        """Test that `AsaFractionalNftTotal` raises an error if a value is out of bounds."""
+        for n in (-1, 0, 2**64):
+            with pytest.raises(ValidationError, match=OUT_OF_BOUNDS_ERROR):
+                self.ta.validate_python(n)
 
     @pytest.mark.parametrize(
         "n", [10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000, 1000000000]
@@ -174,6 +212,12 @@ class TestAsaFractionalNftTotal:
 class TestUrlTypes:
     """Test `AsaUrl`, `Arc3Url`, and `Arc3LocalizedUrl`."""
 
+    ta: dict[Any, TypeAdapter[str]] = {
+        AsaUrl: TypeAdapter(AsaUrl),
+        Arc3Url: TypeAdapter(Arc3Url),
+        Arc3LocalizedUrl: TypeAdapter(Arc3LocalizedUrl),
+    }
+
     @pytest.mark.parametrize(
         "_type, x",
         [
@@ -184,38 +228,31 @@ class TestUrlTypes:
     )
     def test_url_is_string(self, _type: type, x: str) -> None:
         """Test that the type returns a string when passed a valid URL."""
-        ta = TypeAdapter(_type)  # type: ignore
-        assert isinstance(ta.validate_python(x), str)
+        assert isinstance(self.ta[_type].validate_python(x), str)
 
     @pytest.mark.parametrize("_type", [Arc3Url, Arc3LocalizedUrl])
     def test_asa_url_invalid(self, _type: type) -> None:
         """Test that subtype raises an error if the value is not a valid URL."""
-        ta = TypeAdapter(_type)  # type: ignore
         with pytest.raises(ValidationError):
-            ta.validate_python("example.com")
+            self.ta[_type].validate_python("example.com")
 
     @pytest.mark.parametrize("_type", [AsaUrl, Arc3Url, Arc3LocalizedUrl])
     def test_url_encoded_length_out_of_bounds(self, _type: type) -> None:
         """Test that the subtype raises an error if the encoded length of the value > 96 bytes."""
-        ta = TypeAdapter(_type)  # type: ignore
         with pytest.raises(ValidationError):
-            ta.validate_python(
-                "https://www.example.com/1234567890123456789012345678901234567890123456789012345678901234567890123"
-            )
+            self.ta[_type].validate_python(LONG_URL)
 
     @pytest.mark.parametrize("_type", [Arc3Url, Arc3LocalizedUrl])
     def test_url_invalid_scheme(self, _type: type) -> None:
         """Test that the subtype raises an error when passed a URL with a scheme that is not 'https' or 'ipfs'."""
-        ta = TypeAdapter(_type)  # type: ignore
         with pytest.raises(ValidationError):
-            ta.validate_python("http://example.com/")
+            self.ta[_type].validate_python("http://example.com/")
 
     @pytest.mark.parametrize("_type", [Arc3Url, Arc3LocalizedUrl])
     def test_url_invalid_gateway(self, _type: type) -> None:
         """Test that subtype raises a ValidationError when passed a URL that is a known public IPFS gateway."""
-        ta = TypeAdapter(_type)  # type: ignore
         with pytest.raises(ValidationError):
-            ta.validate_python(
+            self.ta[_type].validate_python(
                 "https://ipfs.io/ipfs/bafybeihkoviema7g3gxyt6la7vd5ho32ictqbilu3wnlo3rs7ewhnp7lly/"
             )
 
@@ -232,8 +269,7 @@ class TestUrlTypes:
     )
     def test_url_valid(self, _type: type, x: str) -> None:
         """Test that subtype returns the original value if the the value is a valid URL and its encoded length is in bounds."""
-        ta = TypeAdapter(_type)  # type: ignore
-        assert str(ta.validate_python(x)) == x
+        assert str(self.ta[_type].validate_python(x)) == x
 
     @pytest.mark.parametrize(
         "x",
@@ -244,8 +280,7 @@ class TestUrlTypes:
     )
     def test_localized_url_valid(self, x: str) -> None:
         """Test that `Arc3LocalizedUrl` returns the original value if the URL is valid and contains the substring '{locale}'."""
-        ta = TypeAdapter(Arc3LocalizedUrl)
-        assert str(ta.validate_python(x)) == x
+        assert str(self.ta[Arc3LocalizedUrl].validate_python(x)) == x
 
     @pytest.mark.parametrize(
         "x",
@@ -256,9 +291,8 @@ class TestUrlTypes:
     )
     def test_arc3_localized_url_invalid(self, x: str) -> None:
         """Test that `Arc3LocalizedUrl` raises an error if URL does not contain the substring '{locale}'."""
-        ta = TypeAdapter(Arc3LocalizedUrl)
         with pytest.raises(ValidationError):
-            ta.validate_python(x)
+            self.ta[Arc3LocalizedUrl].validate_python(x)
 
 
 class TestAsaUnitName:
@@ -272,10 +306,10 @@ class TestAsaUnitName:
         with pytest.raises(ValidationError):
             self.ta.validate_python(x)
 
-    @pytest.mark.parametrize("x", ["", "A", "A" * 8, "USDC"])
-    def test_asa_unit_name_valid(self, x: str) -> None:
+    def test_asa_unit_name_valid(self) -> None:
         """Test that `AsaUnitName` returns the original value if the encoded length of the value is <= 8 bytes."""
-        assert self.ta.validate_python(x) == x
+        for x in ("", "A", "A" * 8, "USDC"):
+            assert self.ta.validate_python(x) == x
 
 
 class TestAsaAssetName:
@@ -289,10 +323,10 @@ class TestAsaAssetName:
         with pytest.raises(ValidationError):
             self.ta.validate_python(x)
 
-    @pytest.mark.parametrize("x", ["", "A", "A" * 32, "USD Coin"])
-    def test_asa_asset_name_valid(self, x: str) -> None:
+    def test_asa_asset_name_valid(self) -> None:
         """Test that `AsaAssetName` returns the original value if the encoded length of the value is <= 32 bytes."""
-        assert self.ta.validate_python(x) == x
+        for x in ("", "A", "A" * 32, "USD Coin"):
+            assert self.ta.validate_python(x) == x
 
 
 class TestArc3Sri:
@@ -328,44 +362,38 @@ class TestArc3Sri:
 
     def test_arc3_sri_valid(self):
         """Test that `Arc3Sri` returns the original string when passed a valid ARC-3 SRI."""
-        assert (
-            self.ta.validate_python(
-                "sha256-LwArA6xMdnFF3bvQjwODpeTG/RVn61weQSuoRyynA1I="
-            )
-            == "sha256-LwArA6xMdnFF3bvQjwODpeTG/RVn61weQSuoRyynA1I="
-        )
+        assert self.ta.validate_python(VALID_SRI) == VALID_SRI
 
 
 class TestMimeType:
     """Test the `MimeType` and `ImageMimeType` types."""
 
+    ta: dict[Any, TypeAdapter[str]] = {
+        MimeType: TypeAdapter(MimeType),
+        ImageMimeType: TypeAdapter(ImageMimeType),
+    }
+
     @pytest.mark.parametrize("subtype", [MimeType, ImageMimeType])
     @pytest.mark.parametrize("x", ["", "img/png", "image/jpg"])
     def test_mime_type_invalid(self, subtype: MimeType | ImageMimeType, x: str) -> None:
         """Test that type raises a ValidationError when passed an invalid MIME type."""
-        ta = TypeAdapter(subtype)  # type: ignore
         with pytest.raises(ValidationError):
-            ta.validate_python(x)
+            self.ta[subtype].validate_python(x)
 
-    @pytest.mark.parametrize(
-        "x", ["image/png", "video/mp4", "audio/mpeg", "audio/ogg", "text/html"]
-    )
-    def test_mime_type_valid(self, x: str) -> None:
+    def test_mime_type_valid(self) -> None:
         """Test that `MimeType` returns the original string when passed a valid MIME type."""
-        ta = TypeAdapter(MimeType)
-        assert ta.validate_python(x) == x
+        for x in ("image/png", "video/mp4", "audio/mpeg", "audio/ogg", "text/html"):
+            assert self.ta[MimeType].validate_python(x) == x
 
     def test_image_mime_type_primary_type_mismatch(self) -> None:
         """Test that `ImageMimeType` raises a ValidationError when passed an invalid MIME type with an invalid primary type."""
-        ta = TypeAdapter(ImageMimeType)
         with pytest.raises(ValidationError):
-            ta.validate_python("video/png")
+            self.ta[ImageMimeType].validate_python("video/png")
 
-    @pytest.mark.parametrize("x", ["image/png", "image/jpeg", "image/gif"])
-    def test_image_mime_type_valid(self, x: str) -> None:
+    def test_image_mime_type_valid(self) -> None:
         """Test that `ImageMimeType` returns the original string when passed a valid MIME type with a primary type specified."""
-        ta = TypeAdapter(ImageMimeType)
-        assert ta.validate_python(x) == x
+        for x in ("image/png", "image/jpeg", "image/gif"):
+            assert self.ta[ImageMimeType].validate_python(x) == x
 
 
 class TestArc3Color:
@@ -385,10 +413,10 @@ class TestArc3Color:
         with pytest.raises(ValidationError):
             self.ta.validate_python(x)
 
-    @pytest.mark.parametrize("x", ["FF5733", "9cb2e3", "374f70"])
-    def test_arc3_color_valid(self, x: str) -> None:
+    def test_arc3_color_valid(self) -> None:
         """Test that `Arc3Color` returns the original string when passed a 6 character hexadecimal string."""
-        assert self.ta.validate_python(x) == x
+        for x in ("FF5733", "9cb2e3", "374f70"):
+            assert self.ta.validate_python(x) == x
 
 
 class TestLocaleString:
@@ -408,10 +436,10 @@ class TestLocaleString:
         with pytest.raises(ValidationError):
             self.ta.validate_python(x)
 
-    @pytest.mark.parametrize("x", ["en", "en_US"])
-    def test_locale_valid(self, x: str) -> None:
+    def test_locale_valid(self) -> None:
         """Test that `UnicodeLocale` returns the original string when passed a valid Unicode CLDR locale."""
-        assert self.ta.validate_python(x) == x
+        for x in ("en", "en_US"):
+            assert self.ta.validate_python(x) == x
 
 
 class TestArc16Traits:
@@ -419,51 +447,33 @@ class TestArc16Traits:
 
     ta = TypeAdapter(Arc16Traits)
 
-    valid_dict = {
-        "background": "red",
-        "shirt_color": "blue",
-        "glasses": "none",
-        "tattoos": 4,
-    }
-
     def test_arc16_traits_valid(self) -> None:
         """Test that validation succeeds when passed a valid dictionary."""
-        assert self.ta.validate_python(self.valid_dict)
-
-    @pytest.mark.parametrize(
-        "x",
-        [
-            # Test invalid key type
-            {1: "bar"},
-            # Test invalid value types
-            {"foo": set()},
-            {"foo": list()},
-            {"foo": tuple()},
-        ],
-    )
-    def test_arc16_traits_invalid_non_strict(
-        self, x: dict[int | str, str | set[int] | list[int] | tuple[int]]
-    ) -> None:
-        """Test that `Arc16Traits` raises a ValidationError when passed a dict with invalid types that can't be coerced."""
-        with pytest.raises(ValidationError):
-            self.ta.validate_python(x)
+        assert self.ta.validate_python({**valid_traits})
 
     @pytest.mark.parametrize(
-        "x",
+        "x, strict",
         [
             # Test invalid key type
-            {1: "bar"},
-            # Test invalid value types
-            {"foo": True},
-            {"foo": 1.0},
+            ({1: "bar"}, False),
+            ({1: "bar"}, True),
+            # Test invalid value types that can't be coerced
+            ({"foo": set()}, False),
+            ({"foo": list()}, False),
+            ({"foo": tuple()}, False),
+            # Test invalid value types in strict mode
+            ({"foo": True}, True),
+            ({"foo": 1.0}, True),
         ],
     )
-    def test_arc16_traits_invalid_strict(
-        self, x: dict[int | str, str | bool | float]
+    def test_arc16_traits_invalid_types(
+        self,
+        x: dict[int | str, str | set[int] | list[int] | tuple[int] | bool | float],
+        strict: bool,
     ) -> None:
-        """Test that `Arc16Traits` raises a ValidationError when passed a dict with invalid types in strict mode."""
+        """Test that `Arc16Traits` raises a ValidationError when passed a dict with invalid types."""
         with pytest.raises(ValidationError):
-            self.ta.validate_python(x, strict=True)
+            self.ta.validate_python(x, strict=strict)
 
     @pytest.mark.parametrize("x, expected", [(True, 1), (1.0, 1)])
     def test_arc16_traits_valid_non_strict_coerced(
@@ -483,35 +493,13 @@ class TestArc3NonTraitProperties:
 
     ta = TypeAdapter(Arc3NonTraitProperties)  # type: ignore
 
-    valid_dict = {
-        "creator": "Tim Smith",
-        "created_at": "January 2, 2022",
-        "rich_property": {
-            "string": "Name",
-            "int": 1,
-            "float": 3.14,
-            "list": ["a", "b", "c"],
-            "css": {
-                "color": "#ffffff",
-                "font-weight": "bold",
-                "text-decoration": "underline",
-            },
-        },
-    }
-
     def test_valid_dict(self) -> None:
         """Test that validation succeeds when passed a valid dictionary."""
-        assert self.ta.validate_python(self.valid_dict)
+        assert self.ta.validate_python({**valid_non_trait_properties})
 
     def test_traits_not_allowed(self) -> None:
         """Test that `Arc3NonTraitProperties` raises a ValidationError when passed a dictionary containing the key 'traits'."""
-        test_dict = self.valid_dict.copy()
-        test_dict["traits"] = {
-            "background": "red",
-            "shirt_color": "blue",
-            "glasses": "none",
-            "tattoos": 4,
-        }
+        test_dict = {**valid_non_trait_properties, "traits": {**valid_traits}}
         with pytest.raises(ValidationError):
             self.ta.validate_python(test_dict)
 
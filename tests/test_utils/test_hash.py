@@ -17,6 +17,7 @@ from algobase.utils.hash import sha256, sha512_256
             b"Hn\xa4b$\xd1\xbbO\xb6\x80\xf3O|\x9a\xd9j\x8f$\xec\x88\xbes\xea\x8eZle&\x0e\x9c\xb8\xa7",
         ),
     ],
+    ids=["hello", "world"],
 )
 def test_sha256(data: bytes, expected_digest: bytes) -> None:
     """Test that sha256() returns the correct hash digest."""
@@ -35,6 +36,7 @@ def test_sha256(data: bytes, expected_digest: bytes) -> None:
             b"\xb8\x00\x7f\xc6@\xbe\xf3\xe2\xf1\x0e\xa7\xad\x96\x81\xf6\xfd\xbd\x13(\x87@i`\xf3eE+\xa0\xa1^e\xe2",
         ),
     ],
+    ids=["hello", "world"],
 )
 def test_sha512_256(data: bytes, expected_digest: bytes) -> None:
     """Test that sha512_256() returns the correct hash digest."""
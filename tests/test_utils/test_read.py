@@ -1,7 +1,23 @@
 """Unit tests for the algobase.utils.read functions."""
 import pytest
 
-from algobase.utils.read import read_ipfs_gateways, read_mime_types
+from algobase.utils.read import (
+    read_ipfs_gateway_hosts,
+    read_ipfs_gateways,
+    read_locale_identifiers,
+    read_mime_type_set,
+    read_mime_types,
+)
+
+
+@pytest.fixture(scope="module")
+def mime_types() -> list[str]:
+    """Pytest fixture for the MIME types, read once for the module.
+
+    Returns:
+        list[str]: The list of MIME types.
+    """
+    return read_mime_types()
 
 
 def test_read_ipfs_gateways() -> None:
@@ -12,6 +28,20 @@ def test_read_ipfs_gateways() -> None:
     assert "https://ipfs.io" in gateways
 
 
+def test_read_ipfs_gateway_hosts() -> None:
+    """Test that read_ipfs_gateway_hosts() returns a set of IPFS gateway hosts."""
+    hosts = read_ipfs_gateway_hosts()
+    assert hosts and isinstance(hosts, frozenset)
+    assert "ipfs.io" in hosts
+
+
+def test_read_locale_identifiers() -> None:
+    """Test that read_locale_identifiers() returns a set of Unicode CLDR locale identifiers."""
+    locales = read_locale_identifiers()
+    assert locales and isinstance(locales, frozenset)
+    assert {"en", "en_US"} <= locales
+
+
 @pytest.mark.parametrize(
     "mime_type",
     [
@@ -22,8 +52,14 @@ def test_read_ipfs_gateways() -> None:
         "audio/mpeg",
     ],
 )
-def test_read_mime_types(mime_type: str) -> None:
+def test_read_mime_types(mime_types: list[str], mime_type: str) -> None:
     """Test that read_mime_types() returns a list of MIME types."""
-    mime_types = read_mime_types()
     assert mime_types and isinstance(mime_types, list)
     assert mime_type in mime_types
+
+
+def test_read_mime_type_set(mime_types: list[str]) -> None:
+    """Test that read_mime_type_set() returns the MIME types as a set."""
+    mime_type_set = read_mime_type_set()
+    assert isinstance(mime_type_set, frozenset)
+    assert mime_type_set == set(mime_types)
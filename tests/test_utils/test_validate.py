@@ -8,6 +8,7 @@ from pydantic import ValidationError
 from pydantic_core import Url
 
 from algobase.utils.validate import (
+    get_type_adapter,
     is_valid,
     validate_address,
     validate_arc3_sri,
@@ -66,7 +67,7 @@ class TestValidateAddress:
         assert validate_address(x) == x
 
     @pytest.mark.parametrize(
-        "x", ["AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA" "12345"]
+        "x", ["AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA", "12345"]
     )
     def test_invalid(self, x: str) -> None:
         """Test that validate_address() raises a ValueError when passed an invalid address."""
@@ -135,6 +136,11 @@ class TestValidateSri:
         with pytest.raises(ValueError):
             validate_sri("sha512-foo") == "sha512-foo"
 
+    def test_invalid_hash_digest_padding(self) -> None:
+        """Test that validate_sri() raises an error when passed an SRI where the hash digest has stray padding."""
+        with pytest.raises(ValueError):
+            validate_sri("sha384-" + "A" * 64 + "=")
+
     def test_invalid_hash_digest_length(self) -> None:
         """Test that validate_sri() raises an error when passed an SRI where the hash digest is the wrong length."""
         with pytest.raises(ValueError):
@@ -339,7 +345,9 @@ def test_validate_base64_valid(x: str) -> None:
     assert validate_base64(x) == x
 
 
-@pytest.mark.parametrize("x", ["SGVsbG8", "d29ybGQ", "SGVsbG8gd29ybGQ", "dHJ1ZQ"])
+@pytest.mark.parametrize(
+    "x", ["SGVsbG8", "d29ybGQ", "SGVsbG8gd29ybGQ", "dHJ1ZQ", "SGVsbG8g="]
+)
 def test_validate_base64_invalid(x: str) -> None:
     """Tests that validate_base64() raise a ValueError when passed an invalid string."""
     with pytest.raises(ValueError):
@@ -347,20 +355,51 @@ def test_validate_base64_invalid(x: str) -> None:
 
 
 @pytest.mark.parametrize(
-    "n", [1, 10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000, 1000000000]
+    "n",
+    [
+        1,
+        10,
+        100,
+        1000,
+        10000,
+        100000,
+        1000000,
+        10000000,
+        100000000,
+        1000000000,
+        10**20,
+        # Too many digits for str(), so needs an explicit id
+        pytest.param(10**5000, id="10**5000"),
+    ],
 )
 def test_validate_is_power_of_10_valid(n: int) -> None:
     """Test that validate_is_power_of_10() returns the original value when passed a valid power of 10."""
     assert validate_is_power_of_10(n) == n
 
 
-@pytest.mark.parametrize("n", [-10, 0, 5, 15])
+@pytest.mark.parametrize(
+    "n",
+    [
+        -10,
+        0,
+        5,
+        15,
+        10**17 + 1,
+        10**20 + 1,
+        pytest.param(10**5000 + 1, id="10**5000 + 1"),
+    ],
+)
 def test_validate_is_power_of_10_invalid(n: int) -> None:
     """Test that validate_is_power_of_10() raises a ValueError when passed an invalid power of 10."""
     with pytest.raises(ValueError):
         validate_is_power_of_10(n)
 
 
+def test_get_type_adapter() -> None:
+    """Test that get_type_adapter() returns the same type adapter for repeated calls with the same type."""
+    assert get_type_adapter(Url) is get_type_adapter(Url)
+
+
 @pytest.mark.parametrize("value, _type", [("https://www.google.com", Url)])
 def test_validate_type_compatibility_valid(value: str, _type: type) -> None:
     """Test that validate_type_compatibility() returns the original value when passed a value that is compatible with the specified type."""
@@ -380,6 +419,8 @@ def test_validate_type_compatibility_invalid(value: str, _type: type) -> None:
         "template-ipfs://{ipfscid:0:dag-pb:reserve:sha2-256}/arc3.json",
         "template-ipfs://{ipfscid:1:raw:reserve:sha2-256}",
         "template-ipfs://{ipfscid:1:dag-pb:reserve:sha2-256}/metadata.json",
+        "template-ipfs://{ipfscid:1:raw:reserve:sha2-256}#arc3",
+        "template-ipfs://{ipfscid:1:raw:reserve:sha2-256}?x=1",
     ],
 )
 def test_validate_arc19_asset_url_valid(url: str) -> None:
@@ -392,6 +433,8 @@ def test_validate_arc19_asset_url_valid(url: str) -> None:
     [
         "template-ipfs://{ipfscid:0:raw:reserve:sha2-256}/arc3.json",
         "template-ipfs://{ipfscid:v1:raw:reserve:sha2-256}",
+        "template-ipfs://example.com/{ipfscid:1:raw:reserve:sha2-256}",
+        "template-ipfs://{ipfscid:0:dag-pb:reserve:sha2-256}junk",
         "{ipfscid:0:dag-pb:reserve:sha2-256}",
         "https://example.com",
     ],